@@ -4,12 +4,33 @@ Performance Analysis Script for GolfFinder CI/CD Pipeline
 Analyzes performance test results and validates against thresholds
 """
 
+from __future__ import annotations
+
 import json
 import sys
 import argparse
+import logging
 from typing import Dict, List, Any
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson  # Optional: much faster parsing for large result files
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # Optional: vectorized threshold checks over many endpoints
+except ImportError:
+    np = None
+
+def flush_section(lines: List[str]) -> None:
+    """Emit a report section with a single buffered stdout write"""
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+
+
 class PerformanceAnalyzer:
     def __init__(self, results_file: str):
         self.results_file = results_file
@@ -27,180 +48,212 @@ class PerformanceAnalyzer:
     def load_results(self) -> Dict[str, Any]:
         """Load performance test results from JSON file"""
         try:
-            with open(self.results_file, 'r') as f:
-                return json.load(f)
+            with open(self.results_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
         except FileNotFoundError:
             print(f"❌ Error: Results file {self.results_file} not found")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
             print(f"❌ Error: Invalid JSON in {self.results_file}: {e}")
             sys.exit(1)
     
     def analyze_response_times(self, results: Dict[str, Any]) -> bool:
         """Analyze API response times"""
-        print("\n📊 Analyzing Response Times")
-        print("-" * 50)
-        
+        lines = ["\n📊 Analyzing Response Times", "-" * 50]
+
         passed = True
         response_times = results.get('response_times', {})
-        
+
+        # Transpose the per-endpoint dicts into structure-of-arrays form in a
+        # single pass; the threshold comparisons then run over contiguous
+        # parallel lists (vectorized when NumPy is installed).
+        endpoints: List[str] = []
+        avg_times: List[float] = []
+        p95_times: List[float] = []
+        p99_times: List[float] = []
+
         for endpoint, metrics in response_times.items():
-            avg_time = metrics.get('average_ms', 0)
-            p95_time = metrics.get('p95_ms', 0)
-            p99_time = metrics.get('p99_ms', 0)
-            
-            print(f"  {endpoint}:")
-            print(f"    Average: {avg_time:.1f}ms")
-            print(f"    95th percentile: {p95_time:.1f}ms")
-            print(f"    99th percentile: {p99_time:.1f}ms")
-            
-            if avg_time > self.thresholds['response_time_ms']:
-                print(f"    ❌ FAIL: Average response time {avg_time:.1f}ms exceeds threshold {self.thresholds['response_time_ms']}ms")
+            endpoints.append(endpoint)
+            avg_times.append(metrics.get('average_ms', 0))
+            p95_times.append(metrics.get('p95_ms', 0))
+            p99_times.append(metrics.get('p99_ms', 0))
+
+        # Hoist the threshold lookups out of the per-endpoint loop
+        avg_threshold = self.thresholds['response_time_ms']
+        p95_threshold = avg_threshold * 2
+
+        if np is not None and endpoints:
+            avg_fails = np.asarray(avg_times) > avg_threshold
+            p95_fails = np.asarray(p95_times) > p95_threshold
+        else:
+            avg_fails = [t > avg_threshold for t in avg_times]
+            p95_fails = [t > p95_threshold for t in p95_times]
+
+        # Only pay the per-metric formatting cost when the endpoint failed or
+        # verbose diagnostics were requested; the lazy level check makes
+        # passing endpoints nearly free on large result sets.
+        verbose = logger.isEnabledFor(logging.DEBUG)
+
+        for i, endpoint in enumerate(endpoints):
+            lines.append(f"  {endpoint}:")
+            if verbose or avg_fails[i] or p95_fails[i]:
+                lines.append(f"    Average: {avg_times[i]:.1f}ms")
+                lines.append(f"    95th percentile: {p95_times[i]:.1f}ms")
+                lines.append(f"    99th percentile: {p99_times[i]:.1f}ms")
+
+            if avg_fails[i]:
+                lines.append(f"    ❌ FAIL: Average response time {avg_times[i]:.1f}ms exceeds threshold {avg_threshold}ms")
                 passed = False
             else:
-                print(f"    ✅ PASS: Average response time within threshold")
-            
-            if p95_time > self.thresholds['response_time_ms'] * 2:
-                print(f"    ❌ FAIL: 95th percentile {p95_time:.1f}ms exceeds threshold {self.thresholds['response_time_ms'] * 2}ms")
+                lines.append(f"    ✅ PASS: Average response time within threshold")
+
+            if p95_fails[i]:
+                lines.append(f"    ❌ FAIL: 95th percentile {p95_times[i]:.1f}ms exceeds threshold {p95_threshold}ms")
                 passed = False
-            
-            print()
-        
+
+            lines.append("")
+
+        flush_section(lines)
         return passed
     
     def analyze_memory_usage(self, results: Dict[str, Any]) -> bool:
         """Analyze memory usage patterns"""
-        print("💾 Analyzing Memory Usage")
-        print("-" * 50)
-        
+        lines = ["💾 Analyzing Memory Usage", "-" * 50]
+
         passed = True
         memory_metrics = results.get('memory_usage', {})
-        
+
         max_memory_mb = memory_metrics.get('max_mb', 0)
         avg_memory_mb = memory_metrics.get('average_mb', 0)
         memory_leaks = memory_metrics.get('potential_leaks', 0)
-        
-        print(f"  Maximum Memory Usage: {max_memory_mb:.1f}MB")
-        print(f"  Average Memory Usage: {avg_memory_mb:.1f}MB")
-        print(f"  Potential Memory Leaks: {memory_leaks}")
-        
+
+        lines.append(f"  Maximum Memory Usage: {max_memory_mb:.1f}MB")
+        lines.append(f"  Average Memory Usage: {avg_memory_mb:.1f}MB")
+        lines.append(f"  Potential Memory Leaks: {memory_leaks}")
+
         if max_memory_mb > self.thresholds['memory_usage_mb']:
-            print(f"  ❌ FAIL: Maximum memory usage {max_memory_mb:.1f}MB exceeds threshold {self.thresholds['memory_usage_mb']}MB")
+            lines.append(f"  ❌ FAIL: Maximum memory usage {max_memory_mb:.1f}MB exceeds threshold {self.thresholds['memory_usage_mb']}MB")
             passed = False
         else:
-            print(f"  ✅ PASS: Memory usage within acceptable limits")
-        
+            lines.append(f"  ✅ PASS: Memory usage within acceptable limits")
+
         if memory_leaks > 0:
-            print(f"  ⚠️  WARNING: {memory_leaks} potential memory leaks detected")
-        
-        print()
+            lines.append(f"  ⚠️  WARNING: {memory_leaks} potential memory leaks detected")
+
+        lines.append("")
+        flush_section(lines)
         return passed
     
     def analyze_battery_impact(self, results: Dict[str, Any]) -> bool:
         """Analyze battery usage impact"""
-        print("🔋 Analyzing Battery Impact")
-        print("-" * 50)
-        
+        lines = ["🔋 Analyzing Battery Impact", "-" * 50]
+
         passed = True
         battery_metrics = results.get('battery_usage', {})
-        
+
         drain_per_hour = battery_metrics.get('drain_percent_per_hour', 0)
         background_drain = battery_metrics.get('background_drain_percent_per_hour', 0)
         cpu_impact = battery_metrics.get('cpu_usage_percent', 0)
-        
-        print(f"  Battery Drain (Active): {drain_per_hour:.2f}%/hour")
-        print(f"  Battery Drain (Background): {background_drain:.2f}%/hour")
-        print(f"  CPU Usage: {cpu_impact:.1f}%")
-        
+
+        lines.append(f"  Battery Drain (Active): {drain_per_hour:.2f}%/hour")
+        lines.append(f"  Battery Drain (Background): {background_drain:.2f}%/hour")
+        lines.append(f"  CPU Usage: {cpu_impact:.1f}%")
+
         if drain_per_hour > self.thresholds['battery_drain_percent_per_hour']:
-            print(f"  ❌ FAIL: Battery drain {drain_per_hour:.2f}%/hour exceeds threshold {self.thresholds['battery_drain_percent_per_hour']}%/hour")
+            lines.append(f"  ❌ FAIL: Battery drain {drain_per_hour:.2f}%/hour exceeds threshold {self.thresholds['battery_drain_percent_per_hour']}%/hour")
             passed = False
         else:
-            print(f"  ✅ PASS: Battery drain within acceptable limits")
-        
+            lines.append(f"  ✅ PASS: Battery drain within acceptable limits")
+
         if cpu_impact > self.thresholds['cpu_usage_percent']:
-            print(f"  ❌ FAIL: CPU usage {cpu_impact:.1f}% exceeds threshold {self.thresholds['cpu_usage_percent']}%")
+            lines.append(f"  ❌ FAIL: CPU usage {cpu_impact:.1f}% exceeds threshold {self.thresholds['cpu_usage_percent']}%")
             passed = False
-        
-        print()
+
+        lines.append("")
+        flush_section(lines)
         return passed
     
     def analyze_reliability_metrics(self, results: Dict[str, Any]) -> bool:
         """Analyze app reliability and stability"""
-        print("🛡️ Analyzing Reliability Metrics")
-        print("-" * 50)
-        
+        lines = ["🛡️ Analyzing Reliability Metrics", "-" * 50]
+
         passed = True
         reliability_metrics = results.get('reliability', {})
-        
+
         crash_rate = reliability_metrics.get('crash_rate_percent', 0)
         network_timeout_rate = reliability_metrics.get('network_timeout_rate_percent', 0)
         api_success_rate = reliability_metrics.get('api_success_rate_percent', 100)
-        
-        print(f"  Crash Rate: {crash_rate:.3f}%")
-        print(f"  Network Timeout Rate: {network_timeout_rate:.2f}%")
-        print(f"  API Success Rate: {api_success_rate:.2f}%")
-        
+
+        lines.append(f"  Crash Rate: {crash_rate:.3f}%")
+        lines.append(f"  Network Timeout Rate: {network_timeout_rate:.2f}%")
+        lines.append(f"  API Success Rate: {api_success_rate:.2f}%")
+
         if crash_rate > self.thresholds['crash_rate_percent']:
-            print(f"  ❌ FAIL: Crash rate {crash_rate:.3f}% exceeds threshold {self.thresholds['crash_rate_percent']}%")
+            lines.append(f"  ❌ FAIL: Crash rate {crash_rate:.3f}% exceeds threshold {self.thresholds['crash_rate_percent']}%")
             passed = False
         else:
-            print(f"  ✅ PASS: Crash rate within acceptable limits")
-        
+            lines.append(f"  ✅ PASS: Crash rate within acceptable limits")
+
         if network_timeout_rate > self.thresholds['network_timeout_rate_percent']:
-            print(f"  ❌ FAIL: Network timeout rate {network_timeout_rate:.2f}% exceeds threshold {self.thresholds['network_timeout_rate_percent']}%")
+            lines.append(f"  ❌ FAIL: Network timeout rate {network_timeout_rate:.2f}% exceeds threshold {self.thresholds['network_timeout_rate_percent']}%")
             passed = False
-        
+
         if api_success_rate < self.thresholds['api_success_rate_percent']:
-            print(f"  ❌ FAIL: API success rate {api_success_rate:.2f}% below threshold {self.thresholds['api_success_rate_percent']}%")
+            lines.append(f"  ❌ FAIL: API success rate {api_success_rate:.2f}% below threshold {self.thresholds['api_success_rate_percent']}%")
             passed = False
         else:
-            print(f"  ✅ PASS: API success rate meets requirements")
-        
-        print()
+            lines.append(f"  ✅ PASS: API success rate meets requirements")
+
+        lines.append("")
+        flush_section(lines)
         return passed
     
     def analyze_database_performance(self, results: Dict[str, Any]) -> bool:
         """Analyze database query performance"""
-        print("🗄️ Analyzing Database Performance")
-        print("-" * 50)
-        
+        lines = ["🗄️ Analyzing Database Performance", "-" * 50]
+
         passed = True
         db_metrics = results.get('database_performance', {})
-        
+
+        # Hoist the threshold lookup out of the per-query-type loop
+        query_threshold = self.thresholds['database_query_time_ms']
+        verbose = logger.isEnabledFor(logging.DEBUG)
+
         for query_type, metrics in db_metrics.items():
             avg_time = metrics.get('average_query_time_ms', 0)
             max_time = metrics.get('max_query_time_ms', 0)
             slow_queries = metrics.get('slow_query_count', 0)
-            
-            print(f"  {query_type.replace('_', ' ').title()}:")
-            print(f"    Average Query Time: {avg_time:.1f}ms")
-            print(f"    Maximum Query Time: {max_time:.1f}ms")
-            print(f"    Slow Queries (>{self.thresholds['database_query_time_ms']}ms): {slow_queries}")
-            
-            if avg_time > self.thresholds['database_query_time_ms']:
-                print(f"    ❌ FAIL: Average query time {avg_time:.1f}ms exceeds threshold {self.thresholds['database_query_time_ms']}ms")
+
+            lines.append(f"  {query_type.replace('_', ' ').title()}:")
+            if verbose or avg_time > query_threshold or slow_queries > 0:
+                lines.append(f"    Average Query Time: {avg_time:.1f}ms")
+                lines.append(f"    Maximum Query Time: {max_time:.1f}ms")
+                lines.append(f"    Slow Queries (>{query_threshold}ms): {slow_queries}")
+
+            if avg_time > query_threshold:
+                lines.append(f"    ❌ FAIL: Average query time {avg_time:.1f}ms exceeds threshold {query_threshold}ms")
                 passed = False
             else:
-                print(f"    ✅ PASS: Query performance acceptable")
-            
+                lines.append(f"    ✅ PASS: Query performance acceptable")
+
             if slow_queries > 0:
-                print(f"    ⚠️  WARNING: {slow_queries} slow queries detected")
-            
-            print()
-        
+                lines.append(f"    ⚠️  WARNING: {slow_queries} slow queries detected")
+
+            lines.append("")
+
+        flush_section(lines)
         return passed
     
     def generate_performance_report(self, results: Dict[str, Any], all_passed: bool):
         """Generate comprehensive performance report"""
-        print("📋 Performance Test Summary")
-        print("=" * 50)
-        
+        lines = ["📋 Performance Test Summary", "=" * 50]
+
         overall_status = "✅ PASSED" if all_passed else "❌ FAILED"
-        print(f"Overall Status: {overall_status}")
-        print(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        print(f"Test Duration: {results.get('test_duration_seconds', 0):.1f} seconds")
-        print()
+        lines.append(f"Overall Status: {overall_status}")
+        lines.append(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        lines.append(f"Test Duration: {results.get('test_duration_seconds', 0):.1f} seconds")
+        lines.append("")
         
         # Performance Score Calculation
         total_metrics = 0
@@ -217,54 +270,58 @@ class PerformanceAnalyzer:
         
         if total_metrics > 0:
             performance_score = (passed_metrics / total_metrics) * 100
-            print(f"Performance Score: {performance_score:.1f}%")
-            
+            lines.append(f"Performance Score: {performance_score:.1f}%")
+
             if performance_score >= 95:
-                print("🌟 Excellent performance!")
+                lines.append("🌟 Excellent performance!")
             elif performance_score >= 90:
-                print("👍 Good performance")
+                lines.append("👍 Good performance")
             elif performance_score >= 80:
-                print("⚠️  Performance needs attention")
+                lines.append("⚠️  Performance needs attention")
             else:
-                print("🚨 Critical performance issues")
-        
-        print()
-        
+                lines.append("🚨 Critical performance issues")
+
+        lines.append("")
+
         # Recommendations
         if not all_passed:
-            print("🔧 Recommendations:")
-            print("-" * 20)
-            print("1. Optimize slow API endpoints")
-            print("2. Implement caching for frequently accessed data")
-            print("3. Review memory management and fix potential leaks")
-            print("4. Optimize database queries and add indexes")
-            print("5. Consider background processing for heavy operations")
-            print()
+            lines.append("🔧 Recommendations:")
+            lines.append("-" * 20)
+            lines.append("1. Optimize slow API endpoints")
+            lines.append("2. Implement caching for frequently accessed data")
+            lines.append("3. Review memory management and fix potential leaks")
+            lines.append("4. Optimize database queries and add indexes")
+            lines.append("5. Consider background processing for heavy operations")
+            lines.append("")
+
+        flush_section(lines)
     
-    def run_analysis(self) -> bool:
+    def run_analysis(self, fail_fast: bool = False) -> bool:
         """Run complete performance analysis"""
         print("🚀 GolfFinder Performance Analysis")
         print("=" * 80)
-        
+
         results = self.load_results()
-        
-        # Run all analyses
-        response_time_passed = self.analyze_response_times(results)
-        memory_passed = self.analyze_memory_usage(results)
-        battery_passed = self.analyze_battery_impact(results)
-        reliability_passed = self.analyze_reliability_metrics(results)
-        database_passed = self.analyze_database_performance(results)
-        
-        all_passed = all([
-            response_time_passed,
-            memory_passed,
-            battery_passed,
-            reliability_passed,
-            database_passed
-        ])
-        
+
+        analyses = (
+            self.analyze_response_times,
+            self.analyze_memory_usage,
+            self.analyze_battery_impact,
+            self.analyze_reliability_metrics,
+            self.analyze_database_performance,
+        )
+
+        # Default behavior runs every analysis for a full diagnostic picture;
+        # --fail-fast stops at the first failing section for quick CI gating.
+        all_passed = True
+        for analyze in analyses:
+            if not analyze(results):
+                all_passed = False
+                if fail_fast:
+                    break
+
         self.generate_performance_report(results, all_passed)
-        
+
         return all_passed
 
 def main():
@@ -272,8 +329,12 @@ def main():
     parser.add_argument('results_file', help='Path to performance results JSON file')
     parser.add_argument('--strict', action='store_true', help='Use strict performance thresholds')
     parser.add_argument('--output', help='Output report to file')
-    
+    parser.add_argument('--verbose', action='store_true', help='Show per-metric details for passing checks')
+    parser.add_argument('--fail-fast', action='store_true', help='Stop at the first failing analysis section')
+
     args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
     
     # Create performance analyzer
     analyzer = PerformanceAnalyzer(args.results_file)
@@ -287,7 +348,7 @@ def main():
         print()
     
     # Run analysis
-    success = analyzer.run_analysis()
+    success = analyzer.run_analysis(fail_fast=args.fail_fast)
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
@@ -4,12 +4,76 @@ Summary Report Generator for GolfFinder Testing Pipeline
 Creates comprehensive HTML and JSON reports from test results
 """
 
+from __future__ import annotations
+
 import json
 import os
+import sys
 import argparse
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from decimal import Decimal
+from operator import itemgetter
+from typing import Dict, Iterator, List, Any, Optional
+
+try:
+    import orjson  # Optional: much faster parsing for large result files
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: stream huge reports instead of materializing them
+except ImportError:
+    ijson = None
+
+# 64 KiB buffers cut syscall counts on multi-MB report files
+IO_BUFFER_SIZE = 64 * 1024
+
+# One timestamp per run: the generator is a one-shot CLI, so caching the
+# formatted values avoids repeated strftime calls and keeps every stamp in
+# the report consistent.
+RUN_TIMESTAMP = datetime.now()
+RUN_TIMESTAMP_ISO = RUN_TIMESTAMP.isoformat()
+RUN_TIMESTAMP_HUMAN = RUN_TIMESTAMP.strftime('%Y-%m-%d at %H:%M:%S UTC')
+
+# Keys the summarizer actually reads from comprehensive_validation_report.json.
+# Streaming just these keeps peak memory flat for multi-hundred-MB reports.
+COMPREHENSIVE_SUMMARY_KEYS = frozenset({
+    'overall_success', 'total_tests', 'total_passed', 'total_failed',
+    'overall_coverage', 'overall_quality_score', 'recommendations'
+})
+TEST_PLAN_RESULT_KEYS = frozenset({
+    'test_plan', 'success', 'quality_score',
+    'execution_time_seconds', 'coverage_percentage'
+})
+
+
+def _native(value: Any) -> Any:
+    """Coerce ijson's Decimal floats back to float for JSON round-tripping"""
+    return float(value) if isinstance(value, Decimal) else value
+
+def stream_comprehensive_summary(filepath: str) -> Dict[str, Any]:
+    """Stream-parse the comprehensive report, keeping only summarized keys"""
+    summary: Dict[str, Any] = {}
+    with open(filepath, 'rb') as f:
+        for key, value in ijson.kvitems(f, ''):
+            if key in COMPREHENSIVE_SUMMARY_KEYS:
+                summary[key] = _native(value)
+            elif key == 'test_plan_results':
+                summary[key] = [
+                    {k: _native(v) for k, v in plan.items() if k in TEST_PLAN_RESULT_KEYS}
+                    for plan in value
+                ]
+    return summary
+
+def write_json_report(data: Dict[str, Any], path: str) -> None:
+    """Write pretty-printed JSON, serializing with orjson when available"""
+    if orjson:
+        with open(path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', buffering=IO_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2)
 
 def load_test_results(results_directory: str) -> Dict[str, Any]:
     """Load all test results from directory"""
@@ -21,7 +85,7 @@ def load_test_results(results_directory: str) -> Dict[str, Any]:
         'quality_gates': {},
         'coverage_data': {},
         'metadata': {
-            'generation_time': datetime.now().isoformat(),
+            'generation_time': RUN_TIMESTAMP_ISO,
             'results_directory': results_directory
         }
     }
@@ -36,16 +100,34 @@ def load_test_results(results_directory: str) -> Dict[str, Any]:
         'comprehensive_validation_report.json': 'comprehensive'
     }
     
-    for filename, key in result_files.items():
+    def load_result_file(filename: str, key: str) -> Optional[Dict[str, Any]]:
         filepath = os.path.join(results_directory, filename)
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, 'r') as f:
-                    results[key] = json.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load {filename}: {e}")
-                results[key] = {'error': str(e)}
-    
+        # Open directly instead of an exists() pre-check: one stat fewer per
+        # file, and no race if a result file disappears in between.
+        try:
+            if key == 'comprehensive' and ijson:
+                return stream_comprehensive_summary(filepath)
+            with open(filepath, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not load {filename}: {e}")
+            return {'error': str(e)}
+
+    # Reads and parses release the GIL for most of their runtime, so loading
+    # the result files concurrently overlaps disk and parse time.
+    with ThreadPoolExecutor(max_workers=len(result_files)) as executor:
+        futures = {
+            key: executor.submit(load_result_file, filename, key)
+            for filename, key in result_files.items()
+        }
+        for key, future in futures.items():
+            loaded = future.result()
+            if loaded is not None:
+                results[key] = loaded
+
     return results
 
 def calculate_summary_metrics(results: Dict[str, Any]) -> Dict[str, Any]:
@@ -62,42 +144,46 @@ def calculate_summary_metrics(results: Dict[str, Any]) -> Dict[str, Any]:
         'recommendations': []
     }
     
-    # Extract metrics from comprehensive report if available
-    if 'comprehensive' in results and results['comprehensive']:
-        comp = results['comprehensive']
-        summary['overall_status'] = 'PASSED' if comp.get('overall_success', False) else 'FAILED'
-        summary['total_tests'] = comp.get('total_tests', 0)
-        summary['total_passed'] = comp.get('total_passed', 0)
-        summary['total_failed'] = comp.get('total_failed', 0)
-        summary['overall_coverage'] = comp.get('overall_coverage', 0.0)
-        summary['quality_score'] = comp.get('overall_quality_score', 0.0)
-        
-        # Test plan breakdown
-        for test_result in comp.get('test_plan_results', []):
-            summary['test_plan_breakdown'][test_result['test_plan']] = {
-                'success': test_result['success'],
-                'quality_score': test_result['quality_score'],
-                'execution_time': test_result['execution_time_seconds'],
-                'coverage': test_result['coverage_percentage']
+    # Extract metrics from comprehensive report if available; the bound
+    # comp.get avoids re-resolving the accessor for every field
+    comp = results.get('comprehensive')
+    if comp:
+        comp_get = comp.get
+        summary['overall_status'] = 'PASSED' if comp_get('overall_success', False) else 'FAILED'
+        summary['total_tests'] = comp_get('total_tests', 0)
+        summary['total_passed'] = comp_get('total_passed', 0)
+        summary['total_failed'] = comp_get('total_failed', 0)
+        summary['overall_coverage'] = comp_get('overall_coverage', 0.0)
+        summary['quality_score'] = comp_get('overall_quality_score', 0.0)
+
+        # Test plan breakdown: itemgetter pulls all five fields per result in
+        # one C-level call instead of five separate subscript lookups
+        plan_fields = itemgetter('test_plan', 'success', 'quality_score',
+                                 'execution_time_seconds', 'coverage_percentage')
+        for test_result in comp_get('test_plan_results', []):
+            plan_name, success, quality_score, execution_time, coverage = plan_fields(test_result)
+            summary['test_plan_breakdown'][plan_name] = {
+                'success': success,
+                'quality_score': quality_score,
+                'execution_time': execution_time,
+                'coverage': coverage
             }
         
-        summary['recommendations'] = comp.get('recommendations', [])
+        summary['recommendations'] = comp_get('recommendations', [])
     
     # Add critical issues from quality gates
-    if 'quality_gates' in results and results['quality_gates']:
-        qg = results['quality_gates']
-        if 'detailed_results' in qg and 'critical_failures' in qg['detailed_results']:
-            summary['critical_issues'] = qg['detailed_results']['critical_failures']
+    qg = results.get('quality_gates')
+    if qg:
+        detailed = qg.get('detailed_results')
+        if detailed and 'critical_failures' in detailed:
+            summary['critical_issues'] = detailed['critical_failures']
     
     return summary
 
-def generate_html_report(results: Dict[str, Any], summary: Dict[str, Any]) -> str:
-    """Generate comprehensive HTML report"""
-    
-    status_emoji = "✅" if summary['overall_status'] == 'PASSED' else "❌"
-    status_color = "#28a745" if summary['overall_status'] == 'PASSED' else "#dc3545"
-    
-    html = f"""
+# HTML fragments are parsed once at import time and filled per report with
+# str.format; the repo has no Python dependency manifest, so a template
+# engine such as Jinja2 is deliberately not introduced here.
+REPORT_HEADER_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -276,127 +362,157 @@ def generate_html_report(results: Dict[str, Any], summary: Dict[str, Any]) -> st
         <div class="header">
             <h1>🏌️ Golf Finder SwiftUI</h1>
             <p class="subtitle">Comprehensive Testing Report</p>
-            <div class="status-badge">{status_emoji} {summary['overall_status']}</div>
+            <div class="status-badge">{status_emoji} {overall_status}</div>
         </div>
         
         <div class="metrics-grid">
             <div class="metric-card">
-                <div class="metric-value">{summary['quality_score']:.1f}</div>
+                <div class="metric-value">{quality_score:.1f}</div>
                 <div class="metric-label">Quality Score</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{summary['overall_coverage']:.1f}%</div>
+                <div class="metric-value">{overall_coverage:.1f}%</div>
                 <div class="metric-label">Test Coverage</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{summary['total_tests']}</div>
+                <div class="metric-value">{total_tests}</div>
                 <div class="metric-label">Total Tests</div>
             </div>
             <div class="metric-card">
-                <div class="metric-value">{summary['total_passed']}</div>
+                <div class="metric-value">{total_passed}</div>
                 <div class="metric-label">Tests Passed</div>
             </div>
         </div>
 """
-    
-    # Test Plan Results Section
-    if summary['test_plan_breakdown']:
-        html += """
+
+TEST_PLAN_SECTION_OPEN = """
         <div class="section">
             <h2>📋 Test Plan Results</h2>
             <div class="test-plan-grid">
 """
-        
-        for plan_name, plan_data in summary['test_plan_breakdown'].items():
-            status_class = "status-passed" if plan_data['success'] else "status-failed"
-            status_text = "✅ PASSED" if plan_data['success'] else "❌ FAILED"
-            coverage_width = min(100, plan_data['coverage'])
-            
-            html += f"""
+
+TEST_PLAN_CARD_TEMPLATE = """
                 <div class="test-plan-card">
                     <div class="test-plan-header">
                         <div class="test-plan-name">{plan_name}</div>
                         <div class="test-plan-status {status_class}">{status_text}</div>
                     </div>
                     <div>
-                        <strong>Quality Score:</strong> {plan_data['quality_score']:.1f}/100
+                        <strong>Quality Score:</strong> {quality_score:.1f}/100
                     </div>
                     <div>
-                        <strong>Coverage:</strong> {plan_data['coverage']:.1f}%
+                        <strong>Coverage:</strong> {coverage:.1f}%
                         <div class="progress-bar">
                             <div class="progress-fill" style="width: {coverage_width}%"></div>
                         </div>
                     </div>
                     <div>
-                        <strong>Execution Time:</strong> {plan_data['execution_time']:.1f}s
+                        <strong>Execution Time:</strong> {execution_time:.1f}s
                     </div>
                 </div>
 """
-        
-        html += """
-            </div>
-        </div>
-"""
-    
-    # Critical Issues Section
-    if summary['critical_issues']:
-        html += """
+
+ISSUES_SECTION_OPEN = """
         <div class="section">
             <h2>🚨 Critical Issues</h2>
             <div class="issues-list">
 """
-        
-        for issue in summary['critical_issues']:
-            html += f"""
+
+ISSUE_ITEM_TEMPLATE = """
                 <div class="issue-item">
-                    <strong>{issue.get('check', 'Unknown Check')}:</strong> {issue.get('message', 'No message available')}
+                    <strong>{check}:</strong> {message}
                 </div>
 """
-        
-        html += """
-            </div>
-        </div>
-"""
-    
-    # Recommendations Section
-    if summary['recommendations']:
-        html += """
+
+RECOMMENDATIONS_SECTION_OPEN = """
         <div class="section">
             <h2>💡 Recommendations</h2>
             <div class="recommendations">
 """
-        
-        for rec in summary['recommendations']:
-            html += f"""
+
+REC_ITEM_TEMPLATE = """
                 <div class="rec-item">{rec}</div>
 """
-        
-        html += """
+
+SECTION_CLOSE = """
             </div>
         </div>
 """
-    
-    # Raw Data Section (collapsible)
-    html += f"""
+
+# The full results dict is not embedded: re-serializing a multi-hundred-MB
+# report into the page made the HTML unusable and doubled peak memory. The
+# raw JSON artifacts stay available next to this report.
+REPORT_FOOTER_TEMPLATE = """
         <div class="section">
             <h2>📊 Detailed Results</h2>
             <details>
-                <summary>View Raw Data (JSON)</summary>
+                <summary>View Summary Data (JSON)</summary>
                 <pre style="background: #f8f9fa; padding: 1rem; border-radius: 4px; overflow-x: auto;">
-{json.dumps(results, indent=2)}
+{summary_json}
                 </pre>
             </details>
+            <p style="color: #666;">Full raw results are available in the JSON artifacts alongside this report.</p>
         </div>
-        
+
         <div class="timestamp">
-            Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S UTC')}
+            Generated on {generated_at}
         </div>
     </div>
 </body>
 </html>
 """
-    
-    return html
+
+def iter_html_report(results: Dict[str, Any], summary: Dict[str, Any]) -> Iterator[str]:
+    """Yield the HTML report as fragments, so it can stream straight to disk"""
+
+    status_passed = summary['overall_status'] == 'PASSED'
+
+    yield REPORT_HEADER_TEMPLATE.format(
+        status_emoji="✅" if status_passed else "❌",
+        status_color="#28a745" if status_passed else "#dc3545",
+        overall_status=summary['overall_status'],
+        quality_score=summary['quality_score'],
+        overall_coverage=summary['overall_coverage'],
+        total_tests=summary['total_tests'],
+        total_passed=summary['total_passed'],
+    )
+
+    # Test Plan Results Section
+    if summary['test_plan_breakdown']:
+        yield TEST_PLAN_SECTION_OPEN
+        for plan_name, plan_data in summary['test_plan_breakdown'].items():
+            yield TEST_PLAN_CARD_TEMPLATE.format(
+                plan_name=plan_name,
+                status_class="status-passed" if plan_data['success'] else "status-failed",
+                status_text="✅ PASSED" if plan_data['success'] else "❌ FAILED",
+                quality_score=plan_data['quality_score'],
+                coverage=plan_data['coverage'],
+                coverage_width=min(100, plan_data['coverage']),
+                execution_time=plan_data['execution_time'],
+            )
+        yield SECTION_CLOSE
+
+    # Critical Issues Section
+    if summary['critical_issues']:
+        yield ISSUES_SECTION_OPEN
+        for issue in summary['critical_issues']:
+            yield ISSUE_ITEM_TEMPLATE.format(
+                check=issue.get('check', 'Unknown Check'),
+                message=issue.get('message', 'No message available'),
+            )
+        yield SECTION_CLOSE
+
+    # Recommendations Section
+    if summary['recommendations']:
+        yield RECOMMENDATIONS_SECTION_OPEN
+        for rec in summary['recommendations']:
+            yield REC_ITEM_TEMPLATE.format(rec=rec)
+        yield SECTION_CLOSE
+
+    yield REPORT_FOOTER_TEMPLATE.format(
+        summary_json=json.dumps(summary, indent=2),
+        generated_at=RUN_TIMESTAMP_HUMAN,
+    )
 
 def main():
     parser = argparse.ArgumentParser(description='Generate comprehensive test summary report')
@@ -414,14 +530,12 @@ def main():
     print("Calculating summary metrics...")
     summary = calculate_summary_metrics(results)
     
-    # Generate HTML report
+    # Generate and write the HTML report, streaming fragments straight to
+    # the buffered file instead of materializing the full document string
     print(f"Generating HTML report...")
-    html_content = generate_html_report(results, summary)
-    
-    # Write HTML report
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    with open(args.output, 'w') as f:
-        f.write(html_content)
+    with open(args.output, 'w', buffering=IO_BUFFER_SIZE) as f:
+        f.writelines(iter_html_report(results, summary))
     
     print(f"✅ HTML report generated: {args.output}")
     
@@ -433,8 +547,7 @@ def main():
         }
         
         os.makedirs(os.path.dirname(args.json_output), exist_ok=True)
-        with open(args.json_output, 'w') as f:
-            json.dump(json_report, f, indent=2)
+        write_json_report(json_report, args.json_output)
         
         print(f"✅ JSON report generated: {args.json_output}")
     
@@ -465,9 +578,9 @@ def main():
     
     print("="*60)
     
-    # Exit with appropriate code
-    exit_code = 0 if summary['overall_status'] == 'PASSED' else 1
-    exit(exit_code)
+    # Exit with appropriate code; sys.exit rather than the site-provided
+    # exit() builtin, which is absent under python -S
+    sys.exit(0 if summary['overall_status'] == 'PASSED' else 1)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
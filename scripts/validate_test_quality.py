@@ -8,255 +8,479 @@ import json
 import sys
 import os
 import argparse
-import subprocess
-from typing import Dict, List, Any, Tuple
-from datetime import datetime
-import xml.etree.ElementTree as ET
+import re
+import hashlib
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+try:
+    import orjson  # Optional: C-accelerated JSON parsing for the input blobs
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: streaming parser for oversized coverage dumps
+except ImportError:
+    ijson = None
+
+# Coverage dumps with line-level hit maps can reach hundreds of MB;
+# above this size the file is streamed instead of parsed in one piece.
+_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+def _load_json(path: str) -> Any:
+    """Parse a JSON file, through orjson when available"""
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+@lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse cache keyed on the file's identity and stat signature
+
+    Repeat validations in one CI job (e.g. strict and non-strict passes)
+    re-read the same coverage and test-plan files; an unchanged
+    (mtime, size) pair reuses the parsed document.
+    """
+    return _load_json(path)
+
+def _load_json_fresh(path: str) -> Any:
+    st = os.stat(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
+
+# Critical services matched by exact basename; file_coverage keys may be
+# full paths, so the basename is split off before the O(1) lookup.
+_CRITICAL_FILES = frozenset([
+    'APIGatewayService.swift',
+    'GolfCourseService.swift',
+    'RevenueService.swift',
+    'SecurityService.swift',
+    'ServiceContainer.swift',
+])
+
+_REQUIRED_SECURITY_TESTS = frozenset([
+    'sql_injection_protection',
+    'xss_protection',
+    'authentication_bypass_prevention',
+    'input_validation',
+    'encryption_at_rest',
+    'gdpr_compliance',
+])
+
+def _stream_file_coverage(path: str):
+    """Yield (file_name, coverage) pairs from a coverage dump via ijson
+
+    Keeps one record in memory at a time rather than materializing the
+    whole file_coverage mapping.
+    """
+    with open(path, 'rb') as f:
+        for file_name, coverage in ijson.kvitems(f, 'file_coverage'):
+            yield file_name, float(coverage)
+
+def _scandir_names(path: str, dirs_only: bool = False) -> set:
+    """Return the entry names in one directory via a single os.scandir"""
+    try:
+        with os.scandir(path) as it:
+            if dirs_only:
+                return {e.name for e in it if e.is_dir(follow_symlinks=False)}
+            return {e.name for e in it}
+    except OSError:
+        return set()
+
+# Status codes for the result log; parallel code/message arrays replace
+# the old dict-of-lists so counts stay O(1) and grouping is one pass.
+_PASS, _WARN, _FAIL = 0, 1, 2
+
+_TEST_FIELDS = itemgetter('name', 'duration_seconds', 'status', 'is_flaky')
+
+# Case-insensitive scan without the per-record str.lower() allocation
+_PERF_NAME_RE = re.compile('performance', re.IGNORECASE)
+
+def _test_row(test: Dict[str, Any]) -> Tuple[str, float, str, bool]:
+    """Project one test record onto a (name, duration, status, flaky) tuple
+
+    Fully populated records — the common case — take a single C-level
+    itemgetter call instead of four dict .get lookups; sparse records
+    fall back to per-field defaults.
+    """
+    try:
+        return _TEST_FIELDS(test)
+    except KeyError:
+        return (
+            test.get('name', 'Unknown'),
+            test.get('duration_seconds', 0),
+            test.get('status', 'unknown'),
+            test.get('is_flaky', False),
+        )
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON from bytes already in memory, through orjson when available"""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+_MEMO_MAX_ENTRIES = 32
+
+def _security_memo_path() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'golffinder', 'security_memo-v2.json')
+
+def _load_security_memo() -> Dict[str, Any]:
+    try:
+        return _load_json(_security_memo_path())
+    except (OSError, ValueError):
+        return {}
+
+def _store_security_memo(memo: Dict[str, Any]) -> None:
+    """Persist the memo, dropping oldest entries past the size cap
+
+    Best effort: a read-only or missing cache directory never fails
+    the validation run.
+    """
+    while len(memo) > _MEMO_MAX_ENTRIES:
+        memo.pop(next(iter(memo)))
+    path = _security_memo_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(memo, f)
+    except OSError:
+        pass
+
+def _stream_items(path: str, prefix: str):
+    """Yield the items under a JSON prefix one at a time via ijson"""
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, prefix)
+
+def _count_test_files(path: str) -> int:
+    """Count *Tests.swift files under path with an os.scandir walk
+
+    scandir reports each entry's type from the dirent, so the traversal
+    costs one syscall per directory and never materializes file lists
+    the way os.walk does.
+    """
+    count = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('Tests.swift'):
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+@dataclass(frozen=True, slots=True)
+class QualityGates:
+    """Threshold profile a validator instance is specialized to
+
+    Frozen with slots so gate reads are plain attribute loads and a
+    profile cannot drift mid-run.
+    """
+    unit_test_coverage: float = 90.0
+    integration_test_coverage: float = 85.0
+    security_test_coverage: float = 95.0
+    performance_test_success_rate: float = 100.0
+    max_test_duration_minutes: float = 45.0
+    max_flaky_test_percentage: float = 2.0
+    min_assertion_count_per_test: int = 1
+    max_test_method_length_lines: int = 50
+    required_test_categories: Tuple[str, ...] = (
+        'unit', 'integration', 'performance', 'security', 'ui')
+
+STRICT_GATES = QualityGates(
+    unit_test_coverage=95.0,
+    integration_test_coverage=90.0,
+    max_test_duration_minutes=30.0,
+    max_flaky_test_percentage=1.0,
+)
 
 class TestQualityValidator:
-    def __init__(self):
-        self.quality_gates = {
-            'unit_test_coverage': 90.0,
-            'integration_test_coverage': 85.0,
-            'security_test_coverage': 95.0,
-            'performance_test_success_rate': 100.0,
-            'max_test_duration_minutes': 45.0,
-            'max_flaky_test_percentage': 2.0,
-            'min_assertion_count_per_test': 1,
-            'max_test_method_length_lines': 50,
-            'required_test_categories': ['unit', 'integration', 'performance', 'security', 'ui']
-        }
-        
-        self.validation_results = {
-            'passed': [],
-            'failed': [],
-            'warnings': []
-        }
+    def __init__(self, gates: Optional[QualityGates] = None):
+        self.gates = gates or QualityGates()
+        
+        self._codes = array('B')
+        self._msgs: List[str] = []
+        self._counts = [0, 0, 0]
+        self._results_lock = threading.Lock()
+        self._stage_lines = threading.local()
+    
+    def _p(self, line: str) -> None:
+        """Buffer one output line for the current validation stage
+
+        Lines collected during run_validation are flushed with a single
+        write per stage; a validator called directly still prints.
+        """
+        lines = getattr(self._stage_lines, 'lines', None)
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
+    
+    def _record(self, code: int, message: str) -> None:
+        """Append one validation outcome; safe to call from worker threads"""
+        with self._results_lock:
+            self._codes.append(code)
+            self._msgs.append(sys.intern(message))
+            self._counts[code] += 1
     
     def validate_test_coverage(self, coverage_file: str) -> bool:
         """Validate test coverage meets quality gates"""
-        print("📊 Validating Test Coverage")
-        print("-" * 50)
+        self._p("📊 Validating Test Coverage")
+        self._p("-" * 50)
         
         try:
-            with open(coverage_file, 'r') as f:
-                coverage_data = json.load(f)
-            
-            overall_coverage = coverage_data.get('coverage_percentage', 0)
-            file_coverage = coverage_data.get('file_coverage', {})
+            if ijson and os.stat(coverage_file).st_size > _STREAM_THRESHOLD:
+                with open(coverage_file, 'rb') as f:
+                    overall_coverage = next(ijson.items(f, 'coverage_percentage'), 0)
+                file_items = _stream_file_coverage(coverage_file)
+            else:
+                coverage_data = _load_json_fresh(coverage_file)
+                overall_coverage = coverage_data.get('coverage_percentage', 0)
+                file_items = coverage_data.get('file_coverage', {}).items()
             
-            print(f"Overall Coverage: {overall_coverage:.2f}%")
+            self._p(f"Overall Coverage: {overall_coverage:.2f}%")
             
             # Check overall coverage threshold
-            if overall_coverage >= self.quality_gates['unit_test_coverage']:
-                self.validation_results['passed'].append(f"Unit test coverage: {overall_coverage:.2f}%")
-                print(f"✅ Overall coverage meets threshold ({self.quality_gates['unit_test_coverage']}%)")
+            if overall_coverage >= self.gates.unit_test_coverage:
+                self._record(_PASS, f"Unit test coverage: {overall_coverage:.2f}%")
+                self._p(f"✅ Overall coverage meets threshold ({self.gates.unit_test_coverage}%)")
             else:
-                self.validation_results['failed'].append(f"Unit test coverage {overall_coverage:.2f}% below threshold {self.quality_gates['unit_test_coverage']}%")
-                print(f"❌ Overall coverage below threshold")
+                self._record(_FAIL, f"Unit test coverage {overall_coverage:.2f}% below threshold {self.gates.unit_test_coverage}%")
+                self._p(f"❌ Overall coverage below threshold")
             
             # Check critical file coverage
-            critical_files = [
-                'APIGatewayService.swift',
-                'GolfCourseService.swift', 
-                'RevenueService.swift',
-                'SecurityService.swift',
-                'ServiceContainer.swift'
-            ]
-            
-            low_coverage_files = []
-            for file_name, coverage in file_coverage.items():
-                if any(critical in file_name for critical in critical_files):
+            low_coverage_files: List[Tuple[str, float]] = []
+            for file_name, coverage in file_items:
+                if file_name.rsplit('/', 1)[-1] in _CRITICAL_FILES:
                     if coverage < 95.0:
                         low_coverage_files.append((file_name, coverage))
-                        print(f"⚠️  Critical file {file_name}: {coverage:.1f}% coverage")
+                        self._p(f"⚠️  Critical file {file_name}: {coverage:.1f}% coverage")
                     else:
-                        print(f"✅ Critical file {file_name}: {coverage:.1f}% coverage")
+                        self._p(f"✅ Critical file {file_name}: {coverage:.1f}% coverage")
             
             if low_coverage_files:
-                self.validation_results['warnings'].extend([
-                    f"Low coverage in critical file {name}: {cov:.1f}%" 
-                    for name, cov in low_coverage_files
-                ])
+                for name, cov in low_coverage_files:
+                    self._record(_WARN, f"Low coverage in critical file {name}: {cov:.1f}%")
             
-            return overall_coverage >= self.quality_gates['unit_test_coverage']
+            return overall_coverage >= self.gates.unit_test_coverage
             
         except FileNotFoundError:
-            self.validation_results['failed'].append(f"Coverage file not found: {coverage_file}")
-            print(f"❌ Coverage file not found: {coverage_file}")
+            self._record(_FAIL, f"Coverage file not found: {coverage_file}")
+            self._p(f"❌ Coverage file not found: {coverage_file}")
             return False
         except Exception as e:
-            self.validation_results['failed'].append(f"Error reading coverage data: {str(e)}")
-            print(f"❌ Error reading coverage data: {str(e)}")
+            self._record(_FAIL, f"Error reading coverage data: {str(e)}")
+            self._p(f"❌ Error reading coverage data: {str(e)}")
             return False
     
     def validate_test_performance(self, performance_file: str) -> bool:
         """Validate test execution performance"""
-        print("\n⚡ Validating Test Performance")
-        print("-" * 50)
+        self._p("\n⚡ Validating Test Performance")
+        self._p("-" * 50)
         
         try:
-            with open(performance_file, 'r') as f:
-                perf_data = json.load(f)
-            
-            total_duration = perf_data.get('total_test_duration_minutes', 0)
-            test_results = perf_data.get('test_results', [])
+            if ijson and os.stat(performance_file).st_size > _STREAM_THRESHOLD:
+                with open(performance_file, 'rb') as f:
+                    total_duration: float = next(
+                        ijson.items(f, 'total_test_duration_minutes'), 0)
+                test_results: Iterable[Dict[str, Any]] = _stream_items(
+                    performance_file, 'test_results.item')
+            else:
+                perf_data = _load_json(performance_file)
+                total_duration = perf_data.get('total_test_duration_minutes', 0)
+                test_results = perf_data.get('test_results', [])
             
-            print(f"Total Test Duration: {total_duration:.2f} minutes")
+            self._p(f"Total Test Duration: {total_duration:.2f} minutes")
             
             # Check total duration
-            if total_duration <= self.quality_gates['max_test_duration_minutes']:
-                self.validation_results['passed'].append(f"Test duration: {total_duration:.2f} minutes")
-                print(f"✅ Test duration within limit ({self.quality_gates['max_test_duration_minutes']} minutes)")
+            if total_duration <= self.gates.max_test_duration_minutes:
+                self._record(_PASS, f"Test duration: {total_duration:.2f} minutes")
+                self._p(f"✅ Test duration within limit ({self.gates.max_test_duration_minutes} minutes)")
             else:
-                self.validation_results['failed'].append(f"Test duration {total_duration:.2f}m exceeds limit {self.quality_gates['max_test_duration_minutes']}m")
-                print(f"❌ Test duration exceeds limit")
-            
-            # Analyze individual test performance
-            slow_tests = []
-            failed_tests = []
-            flaky_tests = []
-            
-            for test in test_results:
-                test_name = test.get('name', 'Unknown')
-                duration = test.get('duration_seconds', 0)
-                status = test.get('status', 'unknown')
-                
+                self._record(_FAIL, f"Test duration {total_duration:.2f}m exceeds limit {self.gates.max_test_duration_minutes}m")
+                self._p(f"❌ Test duration exceeds limit")
+            
+            # Classify slow/flaky/performance tests in one pass. On suites
+            # with 10k+ results this loop is the hot path, so every test is
+            # touched exactly once and its fields are read exactly once.
+            slow_tests: List[Tuple[str, float]] = []
+            total_count = 0
+            flaky_count = 0
+            perf_total = 0
+            perf_passed = 0
+
+            for name, duration, status, is_flaky in map(_test_row, test_results):
+                total_count += 1
                 if duration > 30:  # Tests taking longer than 30 seconds
-                    slow_tests.append((test_name, duration))
-                
-                if status == 'failed':
-                    failed_tests.append(test_name)
-                
-                if test.get('is_flaky', False):
-                    flaky_tests.append(test_name)
+                    slow_tests.append((name, duration))
+
+                if is_flaky:
+                    flaky_count += 1
+
+                if _PERF_NAME_RE.search(name):
+                    perf_total += 1
+                    if status == 'passed':
+                        perf_passed += 1
             
             # Report slow tests
             if slow_tests:
-                print(f"\n⚠️  Slow Tests ({len(slow_tests)} tests > 30s):")
-                for name, duration in slow_tests[:5]:  # Show top 5
-                    print(f"    {name}: {duration:.1f}s")
-                self.validation_results['warnings'].append(f"{len(slow_tests)} slow tests detected")
+                self._p(f"\n⚠️  Slow Tests ({len(slow_tests)} tests > 30s):")
+                # O(N log 5) selection; the slice it replaces showed the
+                # first five in file order, not the slowest five
+                for name, duration in heapq.nlargest(5, slow_tests, key=itemgetter(1)):
+                    self._p(f"    {name}: {duration:.1f}s")
+                self._record(_WARN, f"{len(slow_tests)} slow tests detected")
             
             # Check flaky tests
-            flaky_percentage = (len(flaky_tests) / len(test_results)) * 100 if test_results else 0
-            if flaky_percentage <= self.quality_gates['max_flaky_test_percentage']:
-                self.validation_results['passed'].append(f"Flaky test rate: {flaky_percentage:.1f}%")
-                print(f"✅ Flaky test rate acceptable: {flaky_percentage:.1f}%")
+            flaky_percentage = (flaky_count / total_count) * 100 if total_count else 0
+            if flaky_percentage <= self.gates.max_flaky_test_percentage:
+                self._record(_PASS, f"Flaky test rate: {flaky_percentage:.1f}%")
+                self._p(f"✅ Flaky test rate acceptable: {flaky_percentage:.1f}%")
             else:
-                self.validation_results['failed'].append(f"Flaky test rate {flaky_percentage:.1f}% exceeds limit {self.quality_gates['max_flaky_test_percentage']}%")
-                print(f"❌ Too many flaky tests: {flaky_percentage:.1f}%")
+                self._record(_FAIL, f"Flaky test rate {flaky_percentage:.1f}% exceeds limit {self.gates.max_flaky_test_percentage}%")
+                self._p(f"❌ Too many flaky tests: {flaky_percentage:.1f}%")
             
             # Check performance test success rate
-            perf_tests = [t for t in test_results if 'performance' in t.get('name', '').lower()]
-            if perf_tests:
-                perf_success_rate = (sum(1 for t in perf_tests if t.get('status') == 'passed') / len(perf_tests)) * 100
-                if perf_success_rate >= self.quality_gates['performance_test_success_rate']:
-                    self.validation_results['passed'].append(f"Performance test success rate: {perf_success_rate:.1f}%")
-                    print(f"✅ Performance tests success rate: {perf_success_rate:.1f}%")
+            if perf_total:
+                perf_success_rate = (perf_passed / perf_total) * 100
+                if perf_success_rate >= self.gates.performance_test_success_rate:
+                    self._record(_PASS, f"Performance test success rate: {perf_success_rate:.1f}%")
+                    self._p(f"✅ Performance tests success rate: {perf_success_rate:.1f}%")
                 else:
-                    self.validation_results['failed'].append(f"Performance test success rate {perf_success_rate:.1f}% below requirement")
-                    print(f"❌ Performance test success rate too low: {perf_success_rate:.1f}%")
+                    self._record(_FAIL, f"Performance test success rate {perf_success_rate:.1f}% below requirement")
+                    self._p(f"❌ Performance test success rate too low: {perf_success_rate:.1f}%")
             
-            return (total_duration <= self.quality_gates['max_test_duration_minutes'] and 
-                   flaky_percentage <= self.quality_gates['max_flaky_test_percentage'])
+            return (total_duration <= self.gates.max_test_duration_minutes and 
+                   flaky_percentage <= self.gates.max_flaky_test_percentage)
             
         except FileNotFoundError:
-            self.validation_results['failed'].append(f"Performance file not found: {performance_file}")
-            print(f"❌ Performance file not found: {performance_file}")
+            self._record(_FAIL, f"Performance file not found: {performance_file}")
+            self._p(f"❌ Performance file not found: {performance_file}")
             return False
         except Exception as e:
-            self.validation_results['failed'].append(f"Error reading performance data: {str(e)}")
-            print(f"❌ Error reading performance data: {str(e)}")
+            self._record(_FAIL, f"Error reading performance data: {str(e)}")
+            self._p(f"❌ Error reading performance data: {str(e)}")
             return False
     
     def validate_security_compliance(self, security_file: str) -> bool:
-        """Validate security test compliance"""
-        print("\n🔒 Validating Security Compliance")
-        print("-" * 50)
+        """Validate security test compliance
+
+        Results are memoized on disk keyed by a digest of the scan file
+        and the thresholds in play, so repeat invocations in one
+        pipeline (e.g. per target) replay the stored outcome instead of
+        re-running the checks.
+        """
+        self._p("\n🔒 Validating Security Compliance")
+        self._p("-" * 50)
         
         try:
-            with open(security_file, 'r') as f:
-                security_data = json.load(f)
+            with open(security_file, 'rb') as f:
+                raw = f.read()
+            
+            digest = hashlib.blake2b(
+                raw + repr(self.gates.security_test_coverage).encode()
+            ).hexdigest()
+            memo = _load_security_memo()
+            cached = memo.get(digest)
+            if cached is not None:
+                self._p("♻️ Security scan unchanged — using cached validation result")
+                for code, message in cached['records']:
+                    self._record(code, message)
+                return cached['ok']
+            
+            security_data = _loads(raw)
             
-            vulnerability_scan = security_data.get('vulnerability_scan', {})
-            security_tests = security_data.get('security_tests', {})
+            vulnerability_scan: Dict[str, Any] = security_data.get('vulnerability_scan', {})
+            security_tests: Dict[str, Any] = security_data.get('security_tests', {})
+            
+            records: List[Tuple[int, str]] = []
             
             # Check vulnerability scan results
-            critical_vulnerabilities = vulnerability_scan.get('critical', 0)
-            high_vulnerabilities = vulnerability_scan.get('high', 0)
-            medium_vulnerabilities = vulnerability_scan.get('medium', 0)
+            critical_vulnerabilities: int = vulnerability_scan.get('critical', 0)
+            high_vulnerabilities: int = vulnerability_scan.get('high', 0)
+            medium_vulnerabilities: int = vulnerability_scan.get('medium', 0)
             
-            print(f"Critical Vulnerabilities: {critical_vulnerabilities}")
-            print(f"High Vulnerabilities: {high_vulnerabilities}")
-            print(f"Medium Vulnerabilities: {medium_vulnerabilities}")
+            self._p(f"Critical Vulnerabilities: {critical_vulnerabilities}")
+            self._p(f"High Vulnerabilities: {high_vulnerabilities}")
+            self._p(f"Medium Vulnerabilities: {medium_vulnerabilities}")
             
             if critical_vulnerabilities == 0:
-                self.validation_results['passed'].append("No critical vulnerabilities found")
-                print("✅ No critical vulnerabilities")
+                records.append((_PASS, "No critical vulnerabilities found"))
+                self._p("✅ No critical vulnerabilities")
             else:
-                self.validation_results['failed'].append(f"{critical_vulnerabilities} critical vulnerabilities found")
-                print(f"❌ Critical vulnerabilities found: {critical_vulnerabilities}")
+                records.append((_FAIL, f"{critical_vulnerabilities} critical vulnerabilities found"))
+                self._p(f"❌ Critical vulnerabilities found: {critical_vulnerabilities}")
             
             if high_vulnerabilities == 0:
-                self.validation_results['passed'].append("No high-severity vulnerabilities found")
-                print("✅ No high-severity vulnerabilities")
+                records.append((_PASS, "No high-severity vulnerabilities found"))
+                self._p("✅ No high-severity vulnerabilities")
             elif high_vulnerabilities <= 2:
-                self.validation_results['warnings'].append(f"{high_vulnerabilities} high-severity vulnerabilities found")
-                print(f"⚠️  High-severity vulnerabilities: {high_vulnerabilities}")
+                records.append((_WARN, f"{high_vulnerabilities} high-severity vulnerabilities found"))
+                self._p(f"⚠️  High-severity vulnerabilities: {high_vulnerabilities}")
             else:
-                self.validation_results['failed'].append(f"Too many high-severity vulnerabilities: {high_vulnerabilities}")
-                print(f"❌ Too many high-severity vulnerabilities: {high_vulnerabilities}")
+                records.append((_FAIL, f"Too many high-severity vulnerabilities: {high_vulnerabilities}"))
+                self._p(f"❌ Too many high-severity vulnerabilities: {high_vulnerabilities}")
             
             # Check security test coverage
-            security_test_coverage = security_tests.get('coverage_percentage', 0)
-            if security_test_coverage >= self.quality_gates['security_test_coverage']:
-                self.validation_results['passed'].append(f"Security test coverage: {security_test_coverage:.1f}%")
-                print(f"✅ Security test coverage: {security_test_coverage:.1f}%")
+            security_test_coverage: float = security_tests.get('coverage_percentage', 0)
+            if security_test_coverage >= self.gates.security_test_coverage:
+                records.append((_PASS, f"Security test coverage: {security_test_coverage:.1f}%"))
+                self._p(f"✅ Security test coverage: {security_test_coverage:.1f}%")
             else:
-                self.validation_results['failed'].append(f"Security test coverage {security_test_coverage:.1f}% below threshold")
-                print(f"❌ Security test coverage too low: {security_test_coverage:.1f}%")
-            
-            # Check specific security test categories
-            required_security_tests = [
-                'sql_injection_protection',
-                'xss_protection', 
-                'authentication_bypass_prevention',
-                'input_validation',
-                'encryption_at_rest',
-                'gdpr_compliance'
-            ]
-            
-            missing_security_tests = []
-            for test_category in required_security_tests:
-                if test_category not in security_tests.get('test_categories', []):
-                    missing_security_tests.append(test_category)
+                records.append((_FAIL, f"Security test coverage {security_test_coverage:.1f}% below threshold"))
+                self._p(f"❌ Security test coverage too low: {security_test_coverage:.1f}%")
+            
+            # Check specific security test categories in one set difference
+            missing_security_tests: List[str] = sorted(
+                _REQUIRED_SECURITY_TESTS - set(security_tests.get('test_categories', []))
+            )
             
             if not missing_security_tests:
-                self.validation_results['passed'].append("All required security tests present")
-                print("✅ All required security test categories covered")
+                records.append((_PASS, "All required security tests present"))
+                self._p("✅ All required security test categories covered")
             else:
-                self.validation_results['failed'].append(f"Missing security tests: {', '.join(missing_security_tests)}")
-                print(f"❌ Missing security test categories: {', '.join(missing_security_tests)}")
+                records.append((_FAIL, f"Missing security tests: {', '.join(missing_security_tests)}"))
+                self._p(f"❌ Missing security test categories: {', '.join(missing_security_tests)}")
             
-            return (critical_vulnerabilities == 0 and 
-                   high_vulnerabilities <= 2 and
-                   security_test_coverage >= self.quality_gates['security_test_coverage'] and
-                   not missing_security_tests)
+            for code, message in records:
+                self._record(code, message)
+            
+            ok = (critical_vulnerabilities == 0 and 
+                  high_vulnerabilities <= 2 and
+                  security_test_coverage >= self.gates.security_test_coverage and
+                  not missing_security_tests)
+            
+            memo[digest] = {'records': records, 'ok': ok}
+            _store_security_memo(memo)
+            
+            return ok
             
         except FileNotFoundError:
-            self.validation_results['failed'].append(f"Security file not found: {security_file}")
-            print(f"❌ Security file not found: {security_file}")
+            self._record(_FAIL, f"Security file not found: {security_file}")
+            self._p(f"❌ Security file not found: {security_file}")
             return False
         except Exception as e:
-            self.validation_results['failed'].append(f"Error reading security data: {str(e)}")
-            print(f"❌ Error reading security data: {str(e)}")
+            self._record(_FAIL, f"Error reading security data: {str(e)}")
+            self._p(f"❌ Error reading security data: {str(e)}")
             return False
     
     def validate_test_structure(self, test_directory: str) -> bool:
         """Validate test project structure and organization"""
-        print("\n🏗️ Validating Test Structure")
-        print("-" * 50)
+        self._p("\n🏗️ Validating Test Structure")
+        self._p("-" * 50)
         
         required_directories = [
             'Unit/Services',
@@ -266,39 +490,48 @@ class TestQualityValidator:
             'UI/Golf'
         ]
         
-        missing_directories = []
+        # One scandir per directory level instead of a stat per required
+        # path: list the top-level names once, then list only the branches
+        # that actually exist.
+        by_top: Dict[str, List[Tuple[str, str]]] = {}
         for req_dir in required_directories:
-            full_path = os.path.join(test_directory, req_dir)
-            if not os.path.exists(full_path):
-                missing_directories.append(req_dir)
+            top, _, rest = req_dir.partition('/')
+            by_top.setdefault(top, []).append((req_dir, rest))
+        
+        found = set()
+        top_names = _scandir_names(test_directory, dirs_only=True)
+        for top, entries in by_top.items():
+            if top not in top_names:
+                continue
+            present = _scandir_names(os.path.join(test_directory, top), dirs_only=True)
+            found.update(req_dir for req_dir, rest in entries if rest in present)
+        missing_directories = sorted(frozenset(required_directories) - found)
         
         if not missing_directories:
-            self.validation_results['passed'].append("All required test directories present")
-            print("✅ Test directory structure is complete")
+            self._record(_PASS, "All required test directories present")
+            self._p("✅ Test directory structure is complete")
         else:
-            self.validation_results['failed'].append(f"Missing test directories: {', '.join(missing_directories)}")
-            print(f"❌ Missing test directories: {', '.join(missing_directories)}")
+            self._record(_FAIL, f"Missing test directories: {', '.join(missing_directories)}")
+            self._p(f"❌ Missing test directories: {', '.join(missing_directories)}")
         
         # Check for test files
-        test_file_count = 0
-        for root, dirs, files in os.walk(test_directory):
-            test_file_count += len([f for f in files if f.endswith('Tests.swift')])
-        
-        print(f"Total test files found: {test_file_count}")
+        test_file_count = _count_test_files(test_directory)
+
+        self._p(f"Total test files found: {test_file_count}")
         
         if test_file_count >= 20:  # Minimum expected test files
-            self.validation_results['passed'].append(f"Adequate test file count: {test_file_count}")
-            print(f"✅ Adequate number of test files: {test_file_count}")
+            self._record(_PASS, f"Adequate test file count: {test_file_count}")
+            self._p(f"✅ Adequate number of test files: {test_file_count}")
         else:
-            self.validation_results['warnings'].append(f"Low test file count: {test_file_count}")
-            print(f"⚠️  Consider adding more test files: {test_file_count}")
+            self._record(_WARN, f"Low test file count: {test_file_count}")
+            self._p(f"⚠️  Consider adding more test files: {test_file_count}")
         
         return not missing_directories
     
     def validate_test_plans(self, test_plans_directory: str) -> bool:
         """Validate Xcode test plan configuration"""
-        print("\n📋 Validating Test Plans")
-        print("-" * 50)
+        self._p("\n📋 Validating Test Plans")
+        self._p("-" * 50)
         
         required_test_plans = [
             'UnitTestPlan.xctestplan',
@@ -307,33 +540,32 @@ class TestQualityValidator:
             'SecurityTestPlan.xctestplan'
         ]
         
-        missing_plans = []
+        present_plans = _scandir_names(test_plans_directory)
+        missing_plans = sorted(frozenset(required_test_plans) - present_plans)
+        
         for plan in required_test_plans:
-            plan_path = os.path.join(test_plans_directory, plan)
-            if not os.path.exists(plan_path):
-                missing_plans.append(plan)
-            else:
+            if plan in present_plans:
+                plan_path = os.path.join(test_plans_directory, plan)
                 # Validate test plan content
                 try:
-                    with open(plan_path, 'r') as f:
-                        plan_content = json.load(f)
+                    plan_content = _load_json_fresh(plan_path)
                     
                     if 'testTargets' in plan_content:
-                        print(f"✅ {plan}: Valid configuration")
+                        self._p(f"✅ {plan}: Valid configuration")
                     else:
-                        self.validation_results['warnings'].append(f"Test plan {plan} missing testTargets")
-                        print(f"⚠️  {plan}: Missing testTargets configuration")
+                        self._record(_WARN, f"Test plan {plan} missing testTargets")
+                        self._p(f"⚠️  {plan}: Missing testTargets configuration")
                         
                 except Exception as e:
-                    self.validation_results['warnings'].append(f"Test plan {plan} validation error: {str(e)}")
-                    print(f"⚠️  {plan}: Validation error - {str(e)}")
+                    self._record(_WARN, f"Test plan {plan} validation error: {str(e)}")
+                    self._p(f"⚠️  {plan}: Validation error - {str(e)}")
         
         if not missing_plans:
-            self.validation_results['passed'].append("All required test plans present")
-            print("✅ All required test plans are present")
+            self._record(_PASS, "All required test plans present")
+            self._p("✅ All required test plans are present")
         else:
-            self.validation_results['failed'].append(f"Missing test plans: {', '.join(missing_plans)}")
-            print(f"❌ Missing test plans: {', '.join(missing_plans)}")
+            self._record(_FAIL, f"Missing test plans: {', '.join(missing_plans)}")
+            self._p(f"❌ Missing test plans: {', '.join(missing_plans)}")
         
         return not missing_plans
     
@@ -342,13 +574,12 @@ class TestQualityValidator:
         print("\n📋 Test Quality Report")
         print("=" * 50)
         
-        total_checks = (len(self.validation_results['passed']) + 
-                       len(self.validation_results['failed']) + 
-                       len(self.validation_results['warnings']))
+        passed_count, warning_count, failed_count = self._counts
+        total_checks = len(self._msgs)
         
-        passed_count = len(self.validation_results['passed'])
-        failed_count = len(self.validation_results['failed'])
-        warning_count = len(self.validation_results['warnings'])
+        grouped: Tuple[List[str], List[str], List[str]] = ([], [], [])
+        for code, message in zip(self._codes, self._msgs):
+            grouped[code].append(message)
         
         quality_score = (passed_count / total_checks * 100) if total_checks > 0 else 0
         
@@ -361,19 +592,19 @@ class TestQualityValidator:
         print(f"Failed: {failed_count}")
         print(f"Warnings: {warning_count}")
         
-        if self.validation_results['passed']:
+        if grouped[_PASS]:
             print(f"\n✅ Passed Checks ({passed_count}):")
-            for check in self.validation_results['passed']:
+            for check in grouped[_PASS]:
                 print(f"    • {check}")
         
-        if self.validation_results['warnings']:
+        if grouped[_WARN]:
             print(f"\n⚠️  Warnings ({warning_count}):")
-            for warning in self.validation_results['warnings']:
+            for warning in grouped[_WARN]:
                 print(f"    • {warning}")
         
-        if self.validation_results['failed']:
+        if grouped[_FAIL]:
             print(f"\n❌ Failed Checks ({failed_count}):")
-            for failure in self.validation_results['failed']:
+            for failure in grouped[_FAIL]:
                 print(f"    • {failure}")
         
         if failed_count == 0:
@@ -393,8 +624,14 @@ class TestQualityValidator:
             'passed': passed_count,
             'failed': failed_count,
             'warnings': warning_count,
-            'details': self.validation_results,
-            'timestamp': datetime.now().isoformat()
+            'details': {
+                'passed': grouped[_PASS],
+                'failed': grouped[_FAIL],
+                'warnings': grouped[_WARN]
+            },
+            # C-side strftime over gmtime: no tz database lookup, and UTC
+            # keeps report timestamps comparable across runner regions
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
         }
     
     def run_validation(self, args) -> bool:
@@ -402,40 +639,63 @@ class TestQualityValidator:
         print("🚀 GolfFinder Test Quality Validation")
         print("=" * 80)
         
-        success = True
-        
-        # Validate test coverage
+        # The five validators are independent I/O-bound stages on distinct
+        # inputs, so they run together on a thread pool and the JSON reads
+        # overlap the filesystem scans.
+        tasks = []
         if args.coverage_file:
-            coverage_valid = self.validate_test_coverage(args.coverage_file)
-            success = success and coverage_valid
-        
-        # Validate test performance
+            tasks.append((self.validate_test_coverage, args.coverage_file))
         if args.performance_file:
-            performance_valid = self.validate_test_performance(args.performance_file)
-            success = success and performance_valid
-        
-        # Validate security compliance
+            tasks.append((self.validate_test_performance, args.performance_file))
         if args.security_file:
-            security_valid = self.validate_security_compliance(args.security_file)
-            success = success and security_valid
-        
-        # Validate test structure
+            tasks.append((self.validate_security_compliance, args.security_file))
         if args.test_directory:
-            structure_valid = self.validate_test_structure(args.test_directory)
-            success = success and structure_valid
-        
-        # Validate test plans
+            tasks.append((self.validate_test_structure, args.test_directory))
         if args.test_plans_directory:
-            plans_valid = self.validate_test_plans(args.test_plans_directory)
-            success = success and plans_valid
+            tasks.append((self.validate_test_plans, args.test_plans_directory))
+        
+        success = True
+        
+        if tasks:
+            buffers: List[List[str]] = [[] for _ in tasks]
+            
+            def run_stage(validator, argument, lines):
+                self._stage_lines.lines = lines
+                try:
+                    return validator(argument)
+                finally:
+                    self._stage_lines.lines = None
+            
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [
+                    executor.submit(run_stage, validator, argument, lines)
+                    for (validator, argument), lines in zip(tasks, buffers)
+                ]
+                for future in futures:
+                    success = future.result() and success
+            
+            # One write per stage instead of one syscall per print()
+            for lines in buffers:
+                if lines:
+                    sys.stdout.write('\n'.join(lines) + '\n')
         
         # Generate report
         report = self.generate_quality_report()
         
         # Save report if requested
         if args.output_file:
-            with open(args.output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            if orjson:
+                buf = orjson.dumps(
+                    report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            else:
+                buf = (json.dumps(report, indent=2) + '\n').encode()
+            # One os.write of the serialized bytes instead of the buffered
+            # writer's chunked syscalls
+            fd = os.open(args.output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
             print(f"\n📄 Report saved to: {args.output_file}")
         
         return success
@@ -452,14 +712,9 @@ def main():
     
     args = parser.parse_args()
     
-    validator = TestQualityValidator()
+    validator = TestQualityValidator(STRICT_GATES if args.strict else None)
     
-    # Adjust thresholds for strict mode
     if args.strict:
-        validator.quality_gates['unit_test_coverage'] = 95.0
-        validator.quality_gates['integration_test_coverage'] = 90.0
-        validator.quality_gates['max_test_duration_minutes'] = 30.0
-        validator.quality_gates['max_flaky_test_percentage'] = 1.0
         print("🔒 Running in STRICT mode with higher quality thresholds")
         print()
     